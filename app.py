@@ -1,13 +1,65 @@
-import cherrypy
-from models import *
 import os
+import threading
 
 TEMPLATE_DIR = os.path.join(os.path.abspath("."), "templates")
 
+# Параметры групповой фиксации посещений
+WRITE_MAX_BATCH = 64
+WRITE_MAX_WAIT = 0.005
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def prewarm():
+    # CherryPy и peewee импортируются при первом запросе; функция позволяет загрузить их заранее
+    import cherrypy
+    import models
+    get_writer()
+
+
+def save_visit(visit_id, patient_name, doctor_name, reason, duration):
+    # Выполняется в потоке записи внутри общей транзакции пачки
+    from models import Visit, Patient, Doctor
+
+    # Автоматическое создание пациента и врача, если их нет
+    patient, _ = Patient.get_or_create(name=patient_name)
+    doctor, _ = Doctor.get_or_create(name=doctor_name)
+
+    # Создание посещения
+    return Visit.create(
+        visit_id=visit_id,
+        patient=patient,
+        doctor=doctor,
+        reason=reason,
+        duration=duration
+    )
+
+
+def get_writer():
+    # Очередь записи создается при первом добавлении посещения
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            from models import db
+            from write_queue import GroupCommitWriter
+            _writer = GroupCommitWriter(db, save_visit, WRITE_MAX_BATCH, WRITE_MAX_WAIT)
+        return _writer
+
+
+def close_writer():
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.close()
+
 
 class VisitApp:
-    @cherrypy.expose
+    # Атрибут exposed вместо @cherrypy.expose, чтобы не импортировать CherryPy при импорте модуля
     def index(self):
+        from models import Visit, Patient, Doctor
+
         # Выбираем посещения, присоединяя Пациента и Врача
         visits = Visit.select().join(Patient).switch(Visit).join(Doctor)
 
@@ -26,8 +78,11 @@ class VisitApp:
             """
         return html.replace("{{rows}}", rows)
 
-    @cherrypy.expose
+    index.exposed = True
+
     def add(self, **kwargs):
+        import cherrypy
+
         if kwargs:
             visit_id = int(kwargs['visit_id'])
             patient_name = kwargs['patient']
@@ -35,25 +90,21 @@ class VisitApp:
             reason = kwargs['reason']
             duration = int(kwargs['duration'])
 
-            # Автоматическое создание пациента и врача, если их нет
-            patient, _ = Patient.get_or_create(name=patient_name)
-            doctor, _ = Doctor.get_or_create(name=doctor_name)
-
-            # Создание посещения
-            Visit.create(
-                visit_id=visit_id,
-                patient=patient,
-                doctor=doctor,
-                reason=reason,
-                duration=duration
-            )
+            # Посещение записывается потоком записи вместе с другими запросами;
+            # перенаправление выполняется только после фиксации транзакции
+            get_writer().submit(visit_id, patient_name, doctor_name, reason, duration).result()
             raise cherrypy.HTTPRedirect("/")
         else:
             html = open(os.path.join(TEMPLATE_DIR, 'add_visit.html'), encoding='utf-8').read()
             return html
 
+    add.exposed = True
+
 
 if __name__ == '__main__':
+    import cherrypy
+    from models import create_tables
+
     # Создаем таблицы и тестовые данные
     create_tables()
 
@@ -64,4 +115,11 @@ if __name__ == '__main__':
         }
     }
 
+    # Фоновый импорт новых строк data.csv в базу данных
+    from cherrypy.process.plugins import Monitor
+    from csv_sync import CsvSync
+    Monitor(cherrypy.engine, CsvSync('data.csv').sync, frequency=2, name='CsvSync').subscribe()
+
+    cherrypy.engine.subscribe('stop', close_writer)
+
     cherrypy.quickstart(VisitApp(), '/', conf)
@@ -0,0 +1,285 @@
+import os
+import io
+import csv
+import time
+import hashlib
+
+from peewee import chunked
+
+from models import db, Patient, Doctor, Visit, SyncState, create_tables
+
+# Сколько байт перед водяной меткой участвует в контрольной сумме
+CHECKSUM_WINDOW = 4096
+
+# Строка-маркер для проверки, закончена ли запись CSV
+_RECORD_MARKER = '\ufffeend-of-batch\ufffe'
+
+
+def main():
+    """
+    Главная функция программы: постоянная синхронизация data.csv с database.db
+    """
+    print("Синхронизация data.csv с базой данных\n")
+    create_tables()
+    CsvSync('data.csv').watch()
+
+
+class CsvSync:
+    """
+    Инкрементальный импорт посещений из CSV-файла в модели Patient, Doctor и Visit.
+
+    Позиция последней импортированной строки (водяная метка) хранится в таблице
+    SyncState вместе с контрольной суммой предшествующих ей байт. Если файл был
+    перезаписан (например, save_visits_to_file в lab3.py), контрольная сумма
+    не совпадет и файл будет импортирован заново без повторов по visit_id.
+    """
+
+    def __init__(self, filename='data.csv', batch_size=100):
+        self.filename = filename
+        self.source = os.path.abspath(filename)
+        self.batch_size = batch_size
+        self._patient_ids = None
+        self._doctor_ids = None
+
+    def sync(self):
+        """
+        Импорт новых строк файла, появившихся после прошлой синхронизации.
+
+        Строки читаются и вставляются пачками по batch_size, водяная метка
+        сдвигается после фиксации каждой пачки, поэтому память не зависит
+        от размера файла, а прерванный импорт продолжается с места остановки.
+
+        Возвращает:
+            int: Количество добавленных посещений
+        """
+        if not os.path.exists(self.filename):
+            return 0
+
+        added = 0
+        with open(self.filename, 'rb') as f:
+            header = f.readline()
+            if not header.endswith(b'\n'):
+                return 0
+            fieldnames = next(csv.reader([header.decode('utf-8-sig')]))
+
+            state, _ = SyncState.get_or_create(source=self.source)
+            offset = state.offset
+            resync = offset < len(header) or self._checksum(f, offset) != state.checksum
+            existing = None
+            if resync:
+                offset = len(header)
+                existing = {v.visit_id for v in Visit.select(Visit.visit_id)}
+
+            while True:
+                f.seek(offset)
+                lines, new_offset = self._read_batch(f)
+                if not lines and not resync:
+                    break
+
+                visits = self._parse_rows(lines, fieldnames, offset)
+                if existing is not None:
+                    visits = [v for v in visits if v['visit_id'] not in existing]
+                with db.atomic():
+                    added += self._insert_visits(visits)
+                    state.checksum = self._checksum(f, new_offset)
+                    state.offset = new_offset
+                    state.save()
+
+                offset = new_offset
+                resync = False
+        return added
+
+    def _read_batch(self, f):
+        """
+        Чтение не более batch_size полных записей начиная с текущей позиции файла
+
+        Недописанная последняя строка, а также запись, у которой не закрыто
+        поле в кавычках (перевод строки внутри поля), остаются до следующей синхронизации.
+
+        Параметры:
+            f: Файл, открытый в двоичном режиме
+
+        Возвращает:
+            tuple: Список строк и позиция файла после последней полной записи
+        """
+        lines = []
+        end = f.tell()
+        pending = []
+        records = 0
+        while records < self.batch_size:
+            line = f.readline()
+            if not line.endswith(b'\n'):
+                break
+            pending.append(line)
+            if self._is_complete(pending):
+                lines.extend(pending)
+                end = f.tell()
+                pending = []
+                records += 1
+        return lines, end
+
+    @staticmethod
+    def _is_complete(lines):
+        """
+        Проверка, что строки образуют законченную запись CSV
+
+        После строк добавляется строка-маркер: если запись закончена, csv.reader
+        вернет маркер отдельной записью, а если поле в кавычках не закрыто,
+        маркер окажется внутри этого поля. Так кавычки внутри поля без кавычек
+        (например, O"Neil) трактуются так же, как в csv.DictReader.
+
+        Параметры:
+            lines (list): Строки файла в двоичном виде
+
+        Возвращает:
+            bool: True, если запись закончена
+        """
+        text = b''.join(lines).decode('utf-8', errors='replace')
+        rows = list(csv.reader(io.StringIO(text + _RECORD_MARKER + '\n', newline='')))
+        return rows[-1] == [_RECORD_MARKER]
+
+    @staticmethod
+    def _parse_rows(lines, fieldnames, offset):
+        """
+        Разбор и проверка строк CSV; некорректные строки пропускаются с сообщением
+
+        Параметры:
+            lines (list): Строки файла в двоичном виде
+            fieldnames (list): Поля заголовка
+            offset (int): Позиция первой строки в файле (для сообщений)
+
+        Возвращает:
+            list: Посещения в виде словарей для вставки в Visit
+        """
+        text = b''.join(lines).decode('utf-8', errors='replace')
+        visits = []
+        for row in csv.DictReader(io.StringIO(text, newline=''), fieldnames=fieldnames):
+            try:
+                visit = {
+                    'visit_id': int(row['id']),
+                    'patient_name': row['patient_name'],
+                    'doctor_name': row['doctor_name'],
+                    'reason': row['reason'],
+                    'duration': int(row['duration'])
+                }
+                if None in visit.values():
+                    raise ValueError("не хватает полей")
+            except (KeyError, TypeError, ValueError) as e:
+                print(f"Пропущена некорректная строка после позиции {offset}: {row} ({e})")
+                continue
+            visits.append(visit)
+        return visits
+
+    def watch(self, interval=1.0):
+        """
+        Бесконечная синхронизация файла с заданным интервалом опроса
+
+        Параметры:
+            interval (float): Интервал между проверками файла в секундах
+        """
+        while True:
+            added = self.sync()
+            if added:
+                print(f"Импортировано посещений: {added}")
+            time.sleep(interval)
+
+    def _insert_visits(self, visits):
+        """
+        Пакетная вставка посещений с созданием недостающих пациентов и врачей
+
+        Параметры:
+            visits (list): Проверенные посещения из _parse_rows
+
+        Возвращает:
+            int: Количество добавленных посещений
+        """
+        if not visits:
+            return 0
+        if self._patient_ids is None:
+            self._patient_ids = self._load_ids(Patient)
+            self._doctor_ids = self._load_ids(Doctor)
+
+        self._create_missing(Patient, self._patient_ids, {visit['patient_name'] for visit in visits})
+        self._create_missing(Doctor, self._doctor_ids, {visit['doctor_name'] for visit in visits})
+
+        visits = [{
+            'visit_id': visit['visit_id'],
+            'patient': self._patient_ids[visit['patient_name']],
+            'doctor': self._doctor_ids[visit['doctor_name']],
+            'reason': visit['reason'],
+            'duration': visit['duration']
+        } for visit in visits]
+        for batch in chunked(visits, self.batch_size):
+            Visit.insert_many(batch).execute()
+        return len(visits)
+
+    def _create_missing(self, model, ids, names):
+        """
+        Создание записей для имен, которых еще нет в кэше идентификаторов
+
+        Параметры:
+            model: Модель Patient или Doctor
+            ids (dict): Кэш соответствия имени и идентификатора
+            names (set): Имена, встретившиеся в новых строках
+        """
+        missing = sorted(names - ids.keys())
+        if not missing:
+            return
+        # Имена могли появиться в базе через веб-приложение после заполнения кэша
+        self._lookup_ids(model, ids, missing)
+        missing = [name for name in missing if name not in ids]
+        for batch in chunked(missing, self.batch_size):
+            model.insert_many([{'name': name} for name in batch]).execute()
+        self._lookup_ids(model, ids, missing)
+
+    def _lookup_ids(self, model, ids, names):
+        """
+        Дополнение кэша идентификаторами записей с указанными именами
+
+        Параметры:
+            model: Модель Patient или Doctor
+            ids (dict): Кэш соответствия имени и идентификатора
+            names (list): Имена для поиска
+        """
+        for batch in chunked(names, self.batch_size):
+            for obj in model.select().where(model.name.in_(batch)).order_by(model.id):
+                ids.setdefault(obj.name, obj.id)
+
+    @staticmethod
+    def _load_ids(model):
+        """
+        Загрузка соответствия имени и идентификатора для модели
+
+        Параметры:
+            model: Модель Patient или Doctor
+
+        Возвращает:
+            dict: Имя -> идентификатор (при дубликатах берется первый)
+        """
+        ids = {}
+        for obj in model.select().order_by(model.id):
+            ids.setdefault(obj.name, obj.id)
+        return ids
+
+    @staticmethod
+    def _checksum(f, offset):
+        """
+        Контрольная сумма байт файла, предшествующих водяной метке
+
+        Параметры:
+            f: Файл, открытый в двоичном режиме
+            offset (int): Позиция водяной метки
+
+        Возвращает:
+            str: SHA-256 последних CHECKSUM_WINDOW байт перед offset
+        """
+        start = max(0, offset - CHECKSUM_WINDOW)
+        f.seek(start)
+        chunk = f.read(offset - start)
+        if len(chunk) != offset - start:
+            return ''
+        return hashlib.sha256(chunk).hexdigest()
+
+
+if __name__ == "__main__":
+    main()
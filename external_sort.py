@@ -0,0 +1,187 @@
+import os
+import csv
+import heapq
+import shutil
+import tempfile
+from itertools import islice
+from operator import itemgetter
+
+FIELDNAMES = ['id', 'patient_name', 'doctor_name', 'reason', 'duration']
+
+
+def main():
+    """
+    Главная функция программы: внешняя сортировка файла data.csv
+    """
+    print("Внешняя сортировка посещений\n")
+
+    if not os.path.exists('data.csv'):
+        print("Файл data.csv не найден.")
+        return
+
+    from lab3 import print_visits
+
+    print("Посещения, отсортированные по ФИО пациента и длительности:")
+    print_visits(list(external_sort_visits('data.csv', keys=('patient_name', 'duration'))))
+
+    print("\nПять самых длинных посещений:")
+    print_visits(list(external_sort_visits('data.csv', keys=('duration',), limit=5, reverse=True)))
+
+
+def read_visit_rows(filename='data.csv'):
+    """
+    Потоковое чтение посещений из CSV-файла без загрузки его в память
+
+    Параметры:
+        filename (str): Имя файла с посещениями
+
+    Возвращает:
+        generator: Словари с информацией о посещениях (duration приведен к int)
+    """
+    with open(filename, 'r', newline='', encoding='utf-8') as csvfile:
+        reader = csv.DictReader(csvfile)
+        for row in reader:
+            row['duration'] = int(row['duration'])
+            yield row
+
+
+def _write_run(rows, tmp_dir, run_number):
+    """
+    Сохранение отсортированной порции посещений во временный файл
+
+    Параметры:
+        rows (list): Отсортированная порция посещений
+        tmp_dir (str): Каталог для временных файлов
+        run_number (int): Порядковый номер порции
+
+    Возвращает:
+        str: Путь к созданному файлу
+    """
+    path = os.path.join(tmp_dir, f'run_{run_number:06d}.csv')
+    with open(path, 'w', newline='', encoding='utf-8') as run_file:
+        writer = csv.DictWriter(run_file, fieldnames=FIELDNAMES, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def _split_into_runs(rows, key, chunk_size, limit, reverse, tmp_dir):
+    """
+    Разбиение потока посещений на отсортированные порции во временных файлах
+
+    Параметры:
+        rows (iterable): Поток посещений
+        key (callable): Функция ключа сортировки
+        chunk_size (int): Максимальное количество посещений в памяти
+        limit (int | None): Если задан, в каждой порции сохраняются только первые limit записей
+        reverse (bool): Сортировка по убыванию
+        tmp_dir (str): Каталог для временных файлов
+
+    Возвращает:
+        list: Пути к временным файлам в порядке следования порций
+    """
+    run_paths = []
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        chunk.sort(key=key, reverse=reverse)
+        if limit is not None:
+            del chunk[limit:]
+        run_paths.append(_write_run(chunk, tmp_dir, len(run_paths)))
+    return run_paths
+
+
+def external_sort_visits(filename='data.csv', keys=('patient_name',), chunk_size=100000,
+                         limit=None, reverse=False, tmp_dir=None):
+    """
+    Внешняя сортировка посещений: файл сортируется порциями ограниченного
+    размера, порции сохраняются во временные файлы и затем сливаются через heapq.merge.
+    Результат совпадает с sorted() по тем же ключам (сортировка устойчива).
+
+    Параметры:
+        filename (str): Имя файла с посещениями
+        keys (tuple): Поля для сортировки в порядке приоритета
+        chunk_size (int): Максимальное количество посещений в памяти при сортировке порции
+        limit (int | None): Вернуть только первые limit посещений (top-k)
+        reverse (bool): Сортировка по убыванию
+        tmp_dir (str | None): Каталог для временных файлов (по умолчанию системный)
+
+    Возвращает:
+        generator: Отсортированные посещения в виде словарей
+    """
+    if isinstance(keys, str):
+        keys = (keys,)
+    if not keys:
+        raise ValueError("Не заданы поля для сортировки")
+    if chunk_size <= 0:
+        raise ValueError("Размер порции должен быть положительным числом")
+    if limit is not None and limit <= 0:
+        return
+
+    key = itemgetter(*keys)
+    work_dir = tempfile.mkdtemp(prefix='visits_sort_', dir=tmp_dir)
+    run_files = []
+    try:
+        run_paths = _split_into_runs(read_visit_rows(filename), key, chunk_size,
+                                     limit, reverse, work_dir)
+        runs = []
+        for path in run_paths:
+            run_file = open(path, 'r', newline='', encoding='utf-8')
+            run_files.append(run_file)
+            runs.append(_read_run(run_file))
+
+        merged = heapq.merge(*runs, key=key, reverse=reverse)
+        if limit is not None:
+            merged = islice(merged, limit)
+        yield from merged
+    finally:
+        for run_file in run_files:
+            run_file.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _read_run(run_file):
+    """
+    Чтение посещений из временного файла порции
+
+    Параметры:
+        run_file: Открытый файл порции
+
+    Возвращает:
+        generator: Посещения порции в исходном порядке
+    """
+    for row in csv.DictReader(run_file):
+        row['duration'] = int(row['duration'])
+        yield row
+
+
+def external_sort_to_file(filename='data.csv', output='data_sorted.csv', keys=('patient_name',),
+                          chunk_size=100000, limit=None, reverse=False, tmp_dir=None):
+    """
+    Внешняя сортировка посещений с записью результата в файл
+
+    Параметры:
+        filename (str): Имя исходного файла с посещениями
+        output (str): Имя файла для отсортированного результата
+        keys (tuple): Поля для сортировки в порядке приоритета
+        chunk_size (int): Максимальное количество посещений в памяти при сортировке порции
+        limit (int | None): Записать только первые limit посещений (top-k)
+        reverse (bool): Сортировка по убыванию
+        tmp_dir (str | None): Каталог для временных файлов
+
+    Возвращает:
+        int: Количество записанных посещений
+    """
+    count = 0
+    with open(output, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES, extrasaction='ignore')
+        writer.writeheader()
+        for visit in external_sort_visits(filename, keys, chunk_size, limit, reverse, tmp_dir):
+            writer.writerow(visit)
+            count += 1
+    return count
+
+
+if __name__ == "__main__":
+    main()
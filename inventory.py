@@ -0,0 +1,132 @@
+import os
+
+
+def main():
+    """
+    Главная функция программы: подсчет файлов в текущей директории и ее поддиректориях
+    """
+    print("Инвентаризация файлов\n")
+    print(f"Файлов в текущей директории: {count_files()}")
+    print(f"Файлов с учетом поддиректорий: {count_files(recursive=True)}")
+
+
+def _normalize_extensions(extensions):
+    """
+    Приведение фильтра расширений к кортежу в нижнем регистре
+
+    Параметры:
+        extensions (str | iterable | None): Расширения вида '.jpg'
+
+    Возвращает:
+        tuple | None: Расширения в нижнем регистре или None, если фильтр не задан
+    """
+    if extensions is None:
+        return None
+    if isinstance(extensions, str):
+        extensions = (extensions,)
+    return tuple(ext.lower() for ext in extensions)
+
+
+def _normalize_path(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _scan_directory(path, extensions, exclude):
+    """
+    Чтение одной директории через os.scandir без дополнительных вызовов stat
+
+    Параметры:
+        path (str): Путь к директории
+        extensions (tuple | None): Фильтр расширений
+        exclude (set): Нормализованные пути директорий, которые не обходятся
+
+    Возвращает:
+        tuple: Список путей к подходящим файлам и список поддиректорий
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not exclude or _normalize_path(entry.path) not in exclude:
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        if extensions is None or entry.name.lower().endswith(extensions):
+                            files.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        # Недоступные директории пропускаются, как в os.walk
+        pass
+    return files, subdirs
+
+
+def iter_files(root='.', extensions=None, recursive=True, workers=None, exclude=()):
+    """
+    Генератор путей к файлам директории
+
+    Файлы выдаются по мере чтения директорий, поэтому обработку можно начинать
+    до окончания обхода. При workers > 1 поддиректории читаются параллельно
+    в пуле потоков, и порядок файлов не определен.
+
+    Параметры:
+        root (str): Корневая директория
+        extensions (str | iterable | None): Расширения файлов, например ('.jpg', '.png')
+        recursive (bool): Обходить ли поддиректории
+        workers (int | None): Количество потоков для параллельного обхода
+        exclude (iterable): Директории, которые не обходятся (например, папка результатов)
+
+    Возвращает:
+        generator: Пути к файлам
+    """
+    extensions = _normalize_extensions(extensions)
+    exclude = {_normalize_path(path) for path in exclude}
+
+    if not recursive or not workers or workers <= 1:
+        pending = [root]
+        while pending:
+            files, subdirs = _scan_directory(pending.pop(), extensions, exclude)
+            yield from files
+            if recursive:
+                pending.extend(reversed(subdirs))
+        return
+
+    # Импорт только для параллельного обхода, чтобы не замедлять запуск main.py
+    from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        running = {executor.submit(_scan_directory, root, extensions, exclude)}
+        try:
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    for subdir in subdirs:
+                        running.add(executor.submit(_scan_directory, subdir, extensions, exclude))
+                    yield from files
+        finally:
+            for future in running:
+                future.cancel()
+
+
+def count_files(root='.', extensions=None, recursive=False, workers=None, exclude=()):
+    """
+    Подсчет файлов в директории
+
+    Параметры:
+        root (str): Директория для подсчета
+        extensions (str | iterable | None): Фильтр расширений
+        recursive (bool): Учитывать ли поддиректории
+        workers (int | None): Количество потоков для параллельного обхода
+        exclude (iterable): Директории, которые не учитываются
+
+    Возвращает:
+        int: Количество файлов
+    """
+    return sum(1 for _ in iter_files(root, extensions, recursive, workers, exclude))
+
+
+if __name__ == "__main__":
+    main()
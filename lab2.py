@@ -78,6 +78,148 @@ def process_matrix(matrix):
     return result
 
 
+class NegativeCountMatrix:
+    """
+    Матрица с поддерживаемыми счетчиками отрицательных элементов.
+
+    Количества отрицательных элементов по строкам, по столбцам и общее
+    количество обновляются при каждом изменении, поэтому изменение одного
+    элемента стоит O(1), а пачка из b изменений - O(b log b) вместо
+    полного пересчета O(N*M) в process_matrix.
+
+    Изменять данные можно только через m[i, j] = ..., set, set_block и update:
+    атрибут matrix доступен только для чтения, а m[index] возвращает копию.
+    """
+
+    def __init__(self, matrix):
+        """
+        Параметры:
+            matrix (numpy.ndarray): Исходная матрица (копируется)
+        """
+        self._matrix = np.array(matrix, order='C')
+        negative = self._matrix < 0
+        self.row_negatives = negative.sum(axis=1)
+        self.col_negatives = negative.sum(axis=0)
+        self.total_negatives = int(negative.sum())
+
+    @property
+    def matrix(self):
+        # Представление только для чтения: запись в обход счетчиков невозможна
+        view = self._matrix.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def shape(self):
+        return self._matrix.shape
+
+    def __getitem__(self, index):
+        # Копия, а не представление: m[i][j] = v не меняет матрицу в обход счетчиков,
+        # а m[i, :] -= k изменяет копию и затем применяется через __setitem__
+        return self._matrix[index].copy()
+
+    def __setitem__(self, index, value):
+        if isinstance(index, tuple) and len(index) == 2 and \
+                all(isinstance(i, (int, np.integer)) for i in index):
+            self.set(index[0], index[1], value)
+        else:
+            self._assign(index, value)
+
+    def set(self, i, j, value):
+        """
+        Изменение одного элемента матрицы
+
+        Параметры:
+            i (int): Номер строки
+            j (int): Номер столбца
+            value: Новое значение
+        """
+        value = self._matrix.dtype.type(value)
+        delta = int(value < 0) - int(self._matrix[i, j] < 0)
+        if delta:
+            self.row_negatives[i] += delta
+            self.col_negatives[j] += delta
+            self.total_negatives += delta
+        self._matrix[i, j] = value
+
+    def set_block(self, rows, cols, values):
+        """
+        Изменение блока матрицы, выбранного так же, как matrix[rows, cols]
+
+        Параметры:
+            rows: Строки блока (номер, срез, список номеров или маска)
+            cols: Столбцы блока (номер, срез, список номеров или маска)
+            values: Значение или массив значений, приводимый к размеру блока
+        """
+        self._assign((rows, cols), values)
+
+    def _assign(self, index, values):
+        """
+        Присваивание по произвольному индексу numpy через пачку изменений
+
+        Параметры:
+            index: Индекс, допустимый для matrix[index]
+            values: Значение или массив значений, приводимый к форме выборки
+        """
+        n, m = self._matrix.shape
+        # Номера строк и столбцов выбранных элементов; индексация работает
+        # одинаково для срезов, списков номеров и масок
+        rows = np.broadcast_to(np.arange(n)[:, None], (n, m))[index]
+        cols = np.broadcast_to(np.arange(m)[None, :], (n, m))[index]
+        values = np.broadcast_to(np.asarray(values).astype(self._matrix.dtype), np.shape(rows))
+        self.update(rows, cols, values)
+
+    def update(self, rows, cols, values):
+        """
+        Применение пачки изменений вида (i, j, значение)
+
+        Если один элемент встречается в пачке несколько раз, остается
+        последнее значение, как при последовательном применении изменений.
+
+        Параметры:
+            rows (array_like): Номера строк
+            cols (array_like): Номера столбцов
+            values (array_like): Новые значения
+        """
+        n, m = self._matrix.shape
+        rows, cols = np.broadcast_arrays(np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp))
+        values = np.broadcast_to(np.asarray(values).astype(self._matrix.dtype), rows.shape).ravel()
+        rows = rows.ravel()
+        cols = cols.ravel()
+        if rows.size == 0:
+            return
+
+        rows = np.where(rows < 0, rows + n, rows)
+        cols = np.where(cols < 0, cols + m, cols)
+        positions = np.ravel_multi_index((rows, cols), (n, m))
+
+        # Оставляем только последнее изменение каждого элемента
+        _, last = np.unique(positions[::-1], return_index=True)
+        keep = positions.size - 1 - last
+        rows, cols, values = rows[keep], cols[keep], values[keep]
+
+        delta = (values < 0).astype(int) - (self._matrix[rows, cols] < 0)
+        np.add.at(self.row_negatives, rows, delta)
+        np.add.at(self.col_negatives, cols, delta)
+        self.total_negatives += int(delta.sum())
+        self._matrix[rows, cols] = values
+
+    def result(self):
+        """
+        Формирование результирующей матрицы, как в process_matrix
+
+        Возвращает:
+            numpy.ndarray: Матрица размером (N+1) x (M+1) с количествами отрицательных элементов
+        """
+        n, m = self._matrix.shape
+        result = np.zeros((n + 1, m + 1), dtype=int)
+        result[:n, :m] = self._matrix
+        result[n, :m] = self.col_negatives
+        result[:n, m] = self.row_negatives
+        result[n, m] = self.total_negatives
+        return result
+
+
 def save_results(original_matrix, result_matrix):
     """
     Функция для сохранения исходной и результирующей матриц в файл.
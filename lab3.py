@@ -2,6 +2,8 @@ import os
 import csv
 from operator import itemgetter
 
+from inventory import count_files
+
 
 def main():
     """
@@ -46,8 +48,8 @@ def count_files_in_directory():
     """
     Функция для подсчета файлов в текущей директории
     """
-    files = [f for f in os.listdir() if os.path.isfile(f)]
-    print(f"Количество файлов в текущей директории: {len(files)}")
+    files_count = count_files()
+    print(f"Количество файлов в текущей директории: {files_count}")
 
 
 def create_sample_file():
@@ -1,6 +1,8 @@
 import os
 import pandas as pd
 
+from inventory import count_files
+
 
 def main():
     print("Лабораторная работа №3. Файлы и словари (с использованием Pandas)\n")
@@ -40,8 +42,8 @@ def main():
 
 def count_files_in_directory():
     """Подсчет файлов в текущей директории"""
-    files = [f for f in os.listdir() if os.path.isfile(f)]
-    print(f"Количество файлов в текущей директории: {len(files)}")
+    files_count = count_files()
+    print(f"Количество файлов в текущей директории: {files_count}")
 
 
 def create_sample_file():
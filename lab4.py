@@ -1,7 +1,9 @@
-import os
 import csv
 from operator import itemgetter
 
+from inventory import count_files
+from visit_store import BinaryVisitStore, write_binary
+
 
 class Visit:
     def __init__(self, visit_id, patient_name, doctor_name, reason, duration):
@@ -43,7 +45,7 @@ class Visit:
 
 class ClinicHistory:
     def __init__(self, visits=None):
-        self._visits = visits or []
+        self._visits = visits if visits is not None else []
 
     def __iter__(self):
         # Реализация итератора
@@ -76,6 +78,23 @@ class ClinicHistory:
             for visit in self._visits:
                 writer.writerow(visit.to_dict())
 
+    def save_to_binary(self, filename='data.bin'):
+        visits = ((v.id, v.patient_name, v.doctor_name, v.reason, v.duration) for v in self._visits)
+        if isinstance(self._visits, BinaryVisitStore):
+            # Хранилище само закрывает отображение, если перезаписывается его файл
+            self._visits.save(filename, visits)
+        else:
+            write_binary(filename, visits)
+
+    @staticmethod
+    def open_binary(filename='data.bin'):
+        # Посещения читаются из файла лениво, по мере обращения к ним
+        try:
+            return ClinicHistory(BinaryVisitStore(filename, factory=Visit))
+        except FileNotFoundError:
+            print("Файл не найден.")
+            return ClinicHistory()
+
     @staticmethod
     def load_from_file(filename='data.csv'):
         try:
@@ -89,6 +108,17 @@ class ClinicHistory:
             print("Файл не найден.")
             return ClinicHistory()
 
+    @staticmethod
+    def load_from_file_parallel(filename='data.csv', workers=None):
+        # Импорт при вызове: пул процессов заметно замедляет импорт lab4
+        from parallel_csv import load_visit_tuples
+
+        try:
+            return ClinicHistory([Visit(*row) for row in load_visit_tuples(filename, workers)])
+        except FileNotFoundError:
+            print("Файл не найден.")
+            return ClinicHistory()
+
     @staticmethod
     def generate_sample_data():
         sample_data = [
@@ -115,8 +145,7 @@ class ExtendedClinicHistory(ClinicHistory):
 
 
 def count_files_in_directory():
-    files = [f for f in os.listdir() if os.path.isfile(f)]
-    return len(files)
+    return count_files()
 
 
 def main():
@@ -1,40 +1,105 @@
-
 import os
-from rembg import remove, new_session
-from PIL import Image
+import argparse
+
+from inventory import iter_files
 
 input_folder = r'C:\Users\k1lla\Downloads\datasetK\test'  # Замените на путь к папке с изображениями
 output_folder = r'C:\Users\k1lla\Downloads\datasetK\test_processed'  # Замените на путь к папке для обработанных изображений
 
-# Создаем выходную папку, если она не существует
-if not os.path.exists(output_folder):
-    os.makedirs(output_folder)
-
-# Создаем сессию с моделью u2netp
 model_name = "u2netp"
-session = new_session(model_name)
+image_extensions = ('.jpg', '.jpeg', '.png')
 
-for filename in os.listdir(input_folder):
-    if filename.endswith(('.jpg', '.jpeg', '.png')):  # Проверяем расширение файла
-        input_path = os.path.join(input_folder, filename)
-        output_path = os.path.join(output_folder, filename)
+# Сессия rembg создается при первом обращении, так как загрузка
+# onnxruntime и модели занимает несколько секунд
+_session = None
 
-        try:
-            input_image = Image.open(input_path)
-            output_image = remove(input_image, session=session)
 
-            # Преобразуем изображение в RGB перед сохранением в JPEG
-            if output_image.mode in ('RGBA', 'P'):
-                output_image = output_image.convert('RGB')
+def get_session():
+    """
+    Ленивое создание сессии rembg с моделью u2netp
+
+    Возвращает:
+        Сессия rembg, общая для всех изображений
+    """
+    global _session
+    if _session is None:
+        from rembg import new_session
+        _session = new_session(model_name)
+    return _session
+
+
+def prewarm():
+    """
+    Предварительная загрузка тяжелых модулей и модели, например до приема задач
+    """
+    import PIL.Image
+    get_session()
+
+
+def process_image(input_path, output_path):
+    """
+    Удаление фона с одного изображения
+
+    Параметры:
+        input_path (str): Путь к исходному изображению
+        output_path (str): Путь для сохранения результата
+    """
+    from PIL import Image
+    from rembg import remove
+
+    input_image = Image.open(input_path)
+    output_image = remove(input_image, session=get_session())
 
-            # Если исходное изображение было PNG, сохраняем как PNG, чтобы сохранить прозрачность
-            if filename.endswith('.png'):
-                output_image.save(output_path)
-            else:
-                output_image.save(output_path, 'JPEG')
+    # Преобразуем изображение в RGB перед сохранением в JPEG
+    if output_image.mode in ('RGBA', 'P'):
+        output_image = output_image.convert('RGB')
 
+    # Если исходное изображение было PNG, сохраняем как PNG, чтобы сохранить прозрачность
+    if input_path.lower().endswith('.png'):
+        output_image.save(output_path)
+    else:
+        output_image.save(output_path, 'JPEG')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Удаление фона с изображений с помощью rembg")
+    parser.add_argument('--input', default=input_folder, help="папка с изображениями")
+    parser.add_argument('--output', default=output_folder, help="папка для обработанных изображений")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="только показать файлы, которые будут обработаны")
+    parser.add_argument('--prewarm', action='store_true',
+                        help="загрузить модель до начала обхода папки")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="количество потоков для обхода папок (при > 1 порядок файлов не определен)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.prewarm and not args.dry_run:
+        prewarm()
+
+    # Обходим папку с подпапками; файлы выдаются по мере чтения директорий.
+    # Папка результатов пропускается, чтобы не обрабатывать уже сохраненные изображения
+    for input_path in iter_files(args.input, image_extensions, recursive=True,
+                                 workers=args.workers, exclude=[args.output]):
+        filename = os.path.relpath(input_path, args.input)
+        output_path = os.path.join(args.output, filename)
+
+        if args.dry_run:
+            print(f"Будет обработано: {filename}")
+            continue
+
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        try:
+            process_image(input_path, output_path)
             print(f"Обработано: {filename}")
         except Exception as e:
             print(f"Ошибка обработки {filename}: {e}")
 
-print("Обработка завершена.")
+    print("Обработка завершена.")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,9 +24,17 @@ class Visit(Model):
     class Meta:
         database = db
 
+class SyncState(Model):
+    source = CharField(unique=True)
+    offset = IntegerField(default=0)
+    checksum = CharField(default='')
+
+    class Meta:
+        database = db
+
 
 def create_tables():
     with db:
-        db.create_tables([Patient, Doctor, Visit])
+        db.create_tables([Patient, Doctor, Visit, SyncState])
 
         #bruh machines
\ No newline at end of file
@@ -0,0 +1,186 @@
+import io
+import os
+import csv
+
+FIELDNAMES = ['id', 'patient_name', 'doctor_name', 'reason', 'duration']
+
+# Файлы меньше этого размера разбираются в текущем процессе
+MIN_PARALLEL_SIZE = 4 * 1024 * 1024
+
+
+def main():
+    """
+    Главная функция программы: параллельная загрузка data.csv
+    """
+    print("Параллельная загрузка посещений\n")
+
+    if not os.path.exists('data.csv'):
+        print("Файл data.csv не найден.")
+        return
+
+    visits = load_visit_tuples('data.csv')
+    print(f"Загружено посещений: {len(visits)}")
+
+
+def split_byte_ranges(filename, parts):
+    """
+    Разбиение файла на диапазоны байт, выровненные по границам строк
+
+    Параметры:
+        filename (str): Имя CSV-файла
+        parts (int): Желаемое количество диапазонов
+
+    Возвращает:
+        tuple: Строка заголовка и список пар (начало, конец) для строк данных
+    """
+    size = os.path.getsize(filename)
+    with open(filename, 'rb') as f:
+        header = f.readline()
+        data_start = f.tell()
+
+        bounds = [data_start]
+        for i in range(1, parts):
+            position = data_start + (size - data_start) * i // parts
+            if position <= bounds[-1]:
+                continue
+            f.seek(position - 1)
+            f.readline()
+            position = f.tell()
+            if bounds[-1] < position < size:
+                bounds.append(position)
+        bounds.append(size)
+
+    ranges = [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+    return header.decode('utf-8'), ranges
+
+
+def _parse_range(task):
+    """
+    Разбор одного диапазона байт CSV-файла в кортежи
+
+    Параметры:
+        task (tuple): Имя файла, начало и конец диапазона, индексы полей в заголовке
+
+    Возвращает:
+        tuple: Список кортежей (id, patient_name, doctor_name, reason, duration)
+            или None, если диапазон не удалось разобрать, и количество кавычек в диапазоне
+    """
+    filename, start, end, columns = task
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8')
+
+    i_id, i_patient, i_doctor, i_reason, i_duration = columns
+    visits = []
+    try:
+        for row in csv.reader(io.StringIO(text, newline='')):
+            if not row:
+                continue
+            visits.append((row[i_id], row[i_patient], row[i_doctor], row[i_reason], int(row[i_duration])))
+    except (IndexError, ValueError, csv.Error):
+        # Диапазон мог начаться внутри поля в кавычках; решение принимает load_visit_tuples
+        visits = None
+    return visits, text.count('"')
+
+
+def load_visit_tuples(filename='data.csv', workers=None):
+    """
+    Параллельная загрузка посещений: файл делится на диапазоны байт,
+    которые разбираются в пуле процессов, результаты объединяются в исходном порядке.
+
+    Если граница диапазона попала внутрь поля с переводом строки в кавычках,
+    файл разбирается последовательно, чтобы результат совпадал с csv.DictReader.
+
+    Параметры:
+        filename (str): Имя CSV-файла
+        workers (int | None): Количество процессов (по умолчанию число ядер)
+
+    Возвращает:
+        list: Кортежи (id, patient_name, doctor_name, reason, duration)
+    """
+    workers = workers or os.cpu_count() or 1
+    if os.path.getsize(filename) < MIN_PARALLEL_SIZE:
+        workers = 1
+
+    header, ranges = split_byte_ranges(filename, workers)
+    fieldnames = next(csv.reader([header]), [])
+    if not fieldnames:
+        return []
+    columns = tuple(fieldnames.index(name) for name in FIELDNAMES)
+    tasks = [(filename, start, end, columns) for start, end in ranges]
+
+    if len(tasks) <= 1:
+        return _parse_serial(tasks)
+
+    # Импорт только для параллельного разбора, чтобы не замедлять импорт модуля
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+        chunks = list(executor.map(_parse_range, tasks))
+
+    # Нечетное число кавычек перед границей означает, что граница попала внутрь
+    # поля с переводом строки; такой файл разбирается последовательно
+    quotes = 0
+    for chunk, chunk_quotes in chunks[:-1]:
+        quotes += chunk_quotes
+        if chunk is None or quotes % 2:
+            return _parse_serial(tasks)
+    if chunks[-1][0] is None:
+        return _parse_serial(tasks)
+
+    return [visit for chunk, _ in chunks for visit in chunk]
+
+
+def _parse_serial(tasks):
+    """
+    Последовательный разбор всех строк данных одним диапазоном
+
+    Параметры:
+        tasks (list): Задания, полученные из split_byte_ranges
+
+    Возвращает:
+        list: Кортежи (id, patient_name, doctor_name, reason, duration)
+    """
+    if not tasks:
+        return []
+    filename, columns = tasks[0][0], tasks[0][3]
+    with open(filename, 'r', newline='', encoding='utf-8') as csvfile:
+        csvfile.readline()
+        i_id, i_patient, i_doctor, i_reason, i_duration = columns
+        return [(row[i_id], row[i_patient], row[i_doctor], row[i_reason], int(row[i_duration]))
+                for row in csv.reader(csvfile) if row]
+
+
+def load_visit_columns(filename='data.csv', workers=None):
+    """
+    Параллельная загрузка посещений в виде столбцов
+
+    Параметры:
+        filename (str): Имя CSV-файла
+        workers (int | None): Количество процессов
+
+    Возвращает:
+        dict: Имя поля -> кортеж значений этого поля
+    """
+    visits = load_visit_tuples(filename, workers)
+    if not visits:
+        return {name: () for name in FIELDNAMES}
+    return dict(zip(FIELDNAMES, zip(*visits)))
+
+
+def read_visits_parallel(filename='data.csv', workers=None):
+    """
+    Параллельный аналог read_visits_from_file из lab3.py
+
+    Параметры:
+        filename (str): Имя CSV-файла
+        workers (int | None): Количество процессов
+
+    Возвращает:
+        list: Список словарей с информацией о посещениях
+    """
+    return [dict(zip(FIELDNAMES, visit)) for visit in load_visit_tuples(filename, workers)]
+
+
+if __name__ == "__main__":
+    main()
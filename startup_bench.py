@@ -0,0 +1,87 @@
+import sys
+import time
+import argparse
+import subprocess
+
+# Команды, время запуска которых должно оставаться малым
+COMMANDS = {
+    'import main': ['-c', 'import main'],
+    'import app': ['-c', 'import app'],
+    'main.py --help': ['main.py', '--help'],
+}
+
+
+def main(argv=None):
+    """
+    Главная функция программы: замер времени запуска через python -X importtime
+    """
+    parser = argparse.ArgumentParser(description="Замер времени запуска модулей")
+    parser.add_argument('--repeat', type=int, default=5, help="количество запусков каждой команды")
+    parser.add_argument('--top', type=int, default=5, help="количество самых долгих импортов в отчете")
+    parser.add_argument('--budget', type=float, default=None,
+                        help="допустимое время импорта в мс; при превышении код возврата 1")
+    args = parser.parse_args(argv)
+
+    print("Время запуска\n")
+    over_budget = False
+    for name, command in COMMANDS.items():
+        wall, imports = measure(command, args.repeat)
+        total = sum(self_us for self_us, _, _ in imports) / 1000
+        print(f"{name}: запуск {wall:.1f} мс, импорты {total:.1f} мс")
+        for _, cumulative, module in sorted(imports, key=lambda i: i[1], reverse=True)[:args.top]:
+            print(f"    {cumulative / 1000:8.1f} мс  {module}")
+        if args.budget is not None and total > args.budget:
+            over_budget = True
+
+    return 1 if over_budget else 0
+
+
+def measure(command, repeat):
+    """
+    Многократный запуск интерпретатора с -X importtime
+
+    Параметры:
+        command (list): Аргументы интерпретатора после -X importtime
+        repeat (int): Количество запусков
+
+    Возвращает:
+        tuple: Лучшее время запуска в мс и импорты лучшего запуска
+    """
+    best_wall = None
+    best_imports = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-X', 'importtime', *command],
+                                capture_output=True, text=True)
+        wall = (time.perf_counter() - start) * 1000
+        if result.returncode != 0:
+            raise RuntimeError(f"Команда {' '.join(command)} завершилась с ошибкой:\n{result.stderr}")
+        if best_wall is None or wall < best_wall:
+            best_wall = wall
+            best_imports = parse_importtime(result.stderr)
+    return best_wall, best_imports
+
+
+def parse_importtime(output):
+    """
+    Разбор вывода -X importtime
+
+    Параметры:
+        output (str): Содержимое stderr интерпретатора
+
+    Возвращает:
+        list: Кортежи (собственное время в мкс, суммарное время в мкс, имя модуля)
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        imports.append((int(fields[0]), int(fields[1]), fields[2].strip()))
+    return imports
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+import pytest
+
+pytest.importorskip('peewee')
+
+import models
+from csv_sync import CsvSync
+
+HEADER = 'id,patient_name,doctor_name,reason,duration\n'
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    models.db.init(str(tmp_path / 'test.db'))
+    models.create_tables()
+    yield tmp_path
+    models.db.close()
+    models.db.init('database.db')
+
+
+def write(path, text):
+    with open(path, 'a', encoding='utf-8', newline='') as f:
+        f.write(text)
+
+
+def visits():
+    return [(v.visit_id, v.patient.name, v.reason, v.duration)
+            for v in models.Visit.select().order_by(models.Visit.id)]
+
+
+def test_appended_rows_are_imported_once(database):
+    write('data.csv', HEADER + '1,A,D,r,10\n2,B,D,r,20\n')
+    sync = CsvSync('data.csv', batch_size=1)
+    assert sync.sync() == 2
+    assert sync.sync() == 0
+
+    write('data.csv', '3,C,D,r,30\n')
+    assert sync.sync() == 1
+    assert [v[0] for v in visits()] == [1, 2, 3]
+
+
+def test_literal_quote_in_unquoted_field(database):
+    write('data.csv', HEADER + '1,O"Neil,d,r,10\n2,B,d,r,20\n3,C,d,r,30\n')
+    sync = CsvSync('data.csv', batch_size=2)
+    assert sync.sync() == 3
+    assert visits()[0] == (1, 'O"Neil', 'r', 10)
+
+    write('data.csv', '4,D,d,r,40\n')
+    assert sync.sync() == 1
+
+
+def test_quoted_multiline_field_waits_until_closed(database):
+    write('data.csv', HEADER + '1,A,d,"first\n')
+    sync = CsvSync('data.csv')
+    assert sync.sync() == 0
+
+    write('data.csv', 'second",5\n')
+    assert sync.sync() == 1
+    assert visits() == [(1, 'A', 'first\nsecond', 5)]
+
+
+def test_partial_and_malformed_rows(database):
+    write('data.csv', HEADER + 'X,bad,d,r,1\n2,B,d,r,20\n3,Par')
+    sync = CsvSync('data.csv')
+    assert sync.sync() == 1
+
+    write('data.csv', 'tial,d,r,3\n')
+    assert sync.sync() == 1
+    assert [v[:2] for v in visits()] == [(2, 'B'), (3, 'Partial')]
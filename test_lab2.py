@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+
+from lab2 import NegativeCountMatrix, process_matrix
+
+
+def check(matrix, reference):
+    assert (matrix.matrix == reference).all()
+    assert (matrix.result() == process_matrix(reference)).all()
+    assert (matrix.result() == process_matrix(matrix.matrix)).all()
+
+
+def test_cell_updates():
+    reference = np.array([[1, -2, 3], [-4, 5, -6]])
+    matrix = NegativeCountMatrix(reference)
+    check(matrix, reference)
+
+    for i, j, value in [(0, 0, -1), (0, 1, 2), (-1, -1, 7), (1, 1, -3), (1, 1, -5)]:
+        matrix[i, j] = value
+        reference[i, j] = value
+        check(matrix, reference)
+
+
+def test_block_updates():
+    reference = np.arange(-12, 12).reshape(4, 6)
+    matrix = NegativeCountMatrix(reference)
+
+    updates = [
+        ((slice(None), slice(0, 1)), -1),
+        ((slice(1, None, 2), 2), [5, -5]),
+        ((2, slice(None)), np.arange(-3, 3)),
+        (([0, 2], slice(1, 3)), -7),
+        (([0, 3], [1, 4]), [4, -4]),
+        (([1, 1], 5), [-9, 9]),
+        ((reference > 3,), -2),
+    ]
+    for index, values in updates:
+        index = index[0] if len(index) == 1 else index
+        matrix[index] = values
+        reference[index] = values
+        check(matrix, reference)
+
+
+def test_batch_updates_with_repeated_cells():
+    reference = np.zeros((3, 3), dtype=int)
+    matrix = NegativeCountMatrix(reference)
+
+    rows = [0, 0, 1, -1, 2, 0]
+    cols = [0, 0, 2, 1, -2, 0]
+    values = [-1, -2, -3, 4, -5, 6]
+    matrix.update(rows, cols, values)
+    for i, j, value in zip(rows, cols, values):
+        reference[i, j] = value
+    check(matrix, reference)
+
+
+def test_non_contiguous_input():
+    source = np.zeros((3, 4), dtype=int)
+    matrix = NegativeCountMatrix(source.T)
+    reference = source.T.copy()
+
+    matrix.update([0, 1, 2], [0, 1, 2], [-1, -2, -3])
+    reference[[0, 1, 2], [0, 1, 2]] = [-1, -2, -3]
+    check(matrix, reference)
+    assert (source == 0).all()
+
+
+def test_random_updates_match_process_matrix():
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        n, m = rng.integers(1, 8, 2)
+        reference = rng.integers(-10, 11, (n, m))
+        matrix = NegativeCountMatrix(reference)
+
+        for _ in range(20):
+            kind = rng.integers(3)
+            if kind == 0:
+                i, j = rng.integers(-n, n), rng.integers(-m, m)
+                value = rng.integers(-5, 6)
+                matrix[i, j] = value
+                reference[i, j] = value
+            elif kind == 1:
+                index = (slice(rng.integers(0, n), None), rng.integers(-m, m))
+                values = rng.integers(-5, 6, size=reference[index].shape)
+                matrix[index] = values
+                reference[index] = values
+            else:
+                size = rng.integers(0, 30)
+                rows = rng.integers(-n, n, size)
+                cols = rng.integers(-m, m, size)
+                values = rng.integers(-5, 6, size)
+                matrix.update(rows, cols, values)
+                for i, j, value in zip(rows, cols, values):
+                    reference[i, j] = value
+            check(matrix, reference)
+
+
+def test_augmented_assignment():
+    reference = np.zeros((2, 2), dtype=int)
+    matrix = NegativeCountMatrix(reference)
+
+    matrix[0, :] -= 1
+    reference[0, :] -= 1
+    check(matrix, reference)
+
+    matrix[:, 1] *= 3
+    reference[:, 1] *= 3
+    check(matrix, reference)
+
+    matrix[1, 1] -= 4
+    reference[1, 1] -= 4
+    check(matrix, reference)
+
+
+def test_reads_do_not_bypass_counters():
+    reference = np.zeros((2, 2), dtype=int)
+    matrix = NegativeCountMatrix(reference)
+
+    # m[i] возвращает копию, поэтому запись в нее не меняет матрицу
+    matrix[0][1] = -5
+    row = matrix[1]
+    row[:] = -1
+    check(matrix, reference)
+
+    with pytest.raises(ValueError):
+        matrix.matrix[0, 1] = -5
+    check(matrix, reference)
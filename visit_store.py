@@ -0,0 +1,291 @@
+import os
+import csv
+import mmap
+import struct
+import tempfile
+
+FIELDNAMES = ['id', 'patient_name', 'doctor_name', 'reason', 'duration']
+
+MAGIC = b'CLNV'
+VERSION = 1
+
+# Заголовок: сигнатура, версия, количество записей, смещение и размер таблицы строк
+HEADER = struct.Struct('<4sHxxQQQ')
+# Запись: id, длительность, индексы пациента, врача и причины в таблице строк
+RECORD = struct.Struct('<qiIII')
+# Смещения строк относительно начала данных таблицы строк
+OFFSET = struct.Struct('<Q')
+
+
+def main():
+    """
+    Главная функция программы: преобразование data.csv в двоичный формат
+    """
+    print("Двоичное хранилище посещений\n")
+
+    if not os.path.exists('data.csv'):
+        print("Файл data.csv не найден.")
+        return
+
+    count = csv_to_binary('data.csv', 'data.bin')
+    print(f"В файл data.bin записано посещений: {count}")
+
+
+def write_binary(filename, visits):
+    """
+    Запись посещений в двоичный файл с фиксированной длиной записи
+
+    Данные пишутся во временный файл в той же директории, который затем
+    заменяет целевой, поэтому при ошибке записи старый файл остается целым.
+
+    Параметры:
+        filename (str): Имя двоичного файла
+        visits (iterable): Кортежи (id, patient_name, doctor_name, reason, duration);
+            id должен быть целым числом или его строковым представлением
+
+    Возвращает:
+        int: Количество записанных посещений
+    """
+    tmp_path, count = _write_temp(filename, visits)
+    _replace(tmp_path, filename)
+    return count
+
+
+def _write_temp(filename, visits):
+    """
+    Запись посещений во временный файл рядом с filename
+
+    Параметры:
+        filename (str): Имя целевого двоичного файла
+        visits (iterable): Кортежи (id, patient_name, doctor_name, reason, duration)
+
+    Возвращает:
+        tuple: Путь к временному файлу и количество записанных посещений
+    """
+    strings = {}
+
+    def intern(value):
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    fd, tmp_path = tempfile.mkstemp(prefix='.visits_', suffix='.tmp',
+                                    dir=os.path.dirname(os.path.abspath(filename)))
+    try:
+        count = 0
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b'\0' * HEADER.size)
+            for visit_id, patient_name, doctor_name, reason, duration in visits:
+                f.write(RECORD.pack(int(visit_id), int(duration), intern(patient_name),
+                                    intern(doctor_name), intern(reason)))
+                count += 1
+
+            strings_offset = f.tell()
+            encoded = [value.encode('utf-8') for value in strings]
+            position = 0
+            for value in encoded:
+                f.write(OFFSET.pack(position))
+                position += len(value)
+            f.write(OFFSET.pack(position))
+            for value in encoded:
+                f.write(value)
+
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, count, strings_offset, len(encoded)))
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return tmp_path, count
+
+
+def _replace(tmp_path, filename):
+    try:
+        # mkstemp создает файл с правами 0600; сохраняем права заменяемого файла
+        os.chmod(tmp_path, os.stat(filename).st_mode if os.path.exists(filename) else 0o644)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def csv_to_binary(csv_filename='data.csv', binary_filename='data.bin'):
+    """
+    Потоковое преобразование CSV-файла посещений в двоичный формат
+
+    Параметры:
+        csv_filename (str): Имя исходного CSV-файла
+        binary_filename (str): Имя двоичного файла
+
+    Возвращает:
+        int: Количество преобразованных посещений
+    """
+    with open(csv_filename, 'r', newline='', encoding='utf-8') as csvfile:
+        rows = csv.DictReader(csvfile)
+        return write_binary(binary_filename, (
+            (row['id'], row['patient_name'], row['doctor_name'], row['reason'], row['duration'])
+            for row in rows
+        ))
+
+
+def binary_to_csv(binary_filename='data.bin', csv_filename='data.csv'):
+    """
+    Преобразование двоичного файла посещений в CSV
+
+    Параметры:
+        binary_filename (str): Имя двоичного файла
+        csv_filename (str): Имя CSV-файла
+
+    Возвращает:
+        int: Количество преобразованных посещений
+    """
+    with BinaryVisitStore(binary_filename) as store, \
+            open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(FIELDNAMES)
+        writer.writerows(store)
+        return len(store)
+
+
+def _as_tuple(*fields):
+    return fields
+
+
+class BinaryVisitStore:
+    """
+    Последовательность посещений, читаемая лениво из отображенного в память файла.
+
+    Записи разбираются только при обращении к ним, поэтому открытие файла
+    не зависит от количества посещений. Новые посещения, добавленные через
+    append, хранятся в памяти и записываются на диск через write_binary.
+    """
+
+    def __init__(self, filename, factory=None):
+        self.factory = factory or _as_tuple
+        self._view = None
+        self._open(filename)
+
+    def _open(self, filename):
+        self.filename = filename
+        self._file = open(filename, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Файл {filename} пуст")
+        self._view = memoryview(self._mmap)
+
+        magic, version, count, strings_offset, strings_count = HEADER.unpack_from(self._view)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Файл {filename} не является хранилищем посещений")
+        self._count = count
+        self._string_offsets = strings_offset
+        self._string_data = strings_offset + (strings_count + 1) * OFFSET.size
+        self._strings = {}
+        self._extra = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+            self._mmap.close()
+            self._file.close()
+
+    def __len__(self):
+        return self._count + len(self._extra)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Индекс посещения вне диапазона")
+        if index >= self._count:
+            return self._extra[index - self._count]
+        return self._read(index)
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self._read(index)
+        yield from self._extra
+
+    def append(self, visit):
+        self._extra.append(visit)
+
+    def save(self, filename, visits):
+        """
+        Запись посещений в двоичный файл, в том числе в файл самого хранилища
+
+        Если filename - файл, отображенный этим хранилищем, отображение закрывается
+        перед заменой файла (иначе чтение усеченного файла приводит к SIGBUS,
+        а в Windows замена открытого файла невозможна) и открывается заново.
+
+        Параметры:
+            filename (str): Имя двоичного файла
+            visits (iterable): Кортежи (id, patient_name, doctor_name, reason, duration),
+                обычно полученные из этого же хранилища
+
+        Возвращает:
+            int: Количество записанных посещений
+        """
+        tmp_path, count = _write_temp(filename, visits)
+        same_file = (self._view is not None and os.path.exists(filename)
+                     and os.path.samefile(filename, self.filename))
+        if same_file:
+            extra = self._extra
+            self.close()
+        try:
+            _replace(tmp_path, filename)
+        except BaseException:
+            if same_file:
+                self._open(filename)
+                self._extra = extra
+            raise
+        if same_file:
+            self._open(filename)
+        return count
+
+    def _read(self, index):
+        """
+        Разбор записи посещения по ее номеру
+
+        Параметры:
+            index (int): Номер записи в файле
+
+        Возвращает:
+            object: Результат factory(id, patient_name, doctor_name, reason, duration)
+        """
+        visit_id, duration, patient, doctor, reason = RECORD.unpack_from(
+            self._view, HEADER.size + index * RECORD.size)
+        return self.factory(str(visit_id), self._string(patient), self._string(doctor),
+                            self._string(reason), duration)
+
+    def _string(self, index):
+        """
+        Чтение строки из таблицы строк с кэшированием
+
+        Параметры:
+            index (int): Номер строки в таблице
+
+        Возвращает:
+            str: Декодированная строка
+        """
+        value = self._strings.get(index)
+        if value is None:
+            start, end = struct.unpack_from('<QQ', self._view,
+                                            self._string_offsets + index * OFFSET.size)
+            value = str(self._view[self._string_data + start:self._string_data + end], 'utf-8')
+            self._strings[index] = value
+        return value
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import time
+import queue
+import threading
+from concurrent.futures import Future
+
+# Признак остановки потока записи
+_STOP = object()
+
+
+class GroupCommitWriter:
+    """
+    Очередь отложенной записи с групповой фиксацией транзакций.
+
+    Обработчики запросов ставят задания в очередь через submit и ждут
+    возвращенный Future. Единственный поток записи забирает задания пачками
+    (не более max_batch заданий или max_wait секунд ожидания) и выполняет их
+    в одной транзакции, поэтому на пачку приходится одна фиксация вместо одной
+    на каждое посещение. Future завершается только после фиксации транзакции.
+    """
+
+    def __init__(self, database, write, max_batch=64, max_wait=0.005):
+        self.database = database
+        self.write = write
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name='GroupCommitWriter', daemon=True)
+        self._thread.start()
+
+    def submit(self, *args, **kwargs):
+        """
+        Постановка задания записи в очередь
+
+        Параметры:
+            args, kwargs: Аргументы функции write
+
+        Возвращает:
+            Future: Результат write, доступный после фиксации транзакции
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Очередь записи остановлена")
+            self._queue.put((args, kwargs, future))
+        return future
+
+    def close(self):
+        """
+        Остановка потока записи после обработки уже поставленных заданий
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+
+    def _run(self):
+        stop = False
+        while not stop:
+            task = self._queue.get()
+            if task is _STOP:
+                break
+
+            batch = [task]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                try:
+                    task = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if task is _STOP:
+                    stop = True
+                    break
+                batch.append(task)
+
+            self._commit(batch)
+
+    def _commit(self, batch):
+        """
+        Выполнение пачки заданий в одной транзакции
+
+        Если одно из заданий завершилось ошибкой, пачка откатывается и задания
+        выполняются по одному, чтобы ошибка досталась только своему обработчику.
+
+        Параметры:
+            batch (list): Задания (args, kwargs, future)
+        """
+        try:
+            with self.database.atomic():
+                results = [self.write(*args, **kwargs) for args, kwargs, _ in batch]
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][2].set_exception(e)
+            else:
+                self._commit_each(batch)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def _commit_each(self, batch):
+        for args, kwargs, future in batch:
+            try:
+                with self.database.atomic():
+                    result = self.write(*args, **kwargs)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)